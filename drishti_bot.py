@@ -1,160 +1,347 @@
 import requests
-from bs4 import BeautifulSoup
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import hashlib
+import orjson
 import os
+import re
 import sys
-from datetime import datetime
+from collections import OrderedDict
+from datetime import datetime, timezone
+from urllib.parse import urljoin
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SECTION_STRAINER = None
+    NEWS_OF_THE_DAY_STRAINER = None
+except ImportError:
+    # Fall back to BeautifulSoup where the selectolax wheel is unavailable
+    LexborHTMLParser = None
+    from bs4 import BeautifulSoup, SoupStrainer
+    # libxml2-backed tree builder; much faster than the pure-Python html.parser
+    BS4_PARSER = "lxml"
+    
+    def has_classes(*names):
+        """Match a raw class attribute containing all ``names``.
+        
+        While parsing, SoupStrainer sees the whole class string (e.g.
+        "list-category daily-news-list"), so it is split before matching.
+        """
+        return lambda value: value is not None and set(names) <= set(value.split())
+    
+    # Only the news list subtree (which holds both sections) is ever queried
+    SECTION_STRAINER = SoupStrainer("div", class_=has_classes("daily-news-list"))
+    NEWS_OF_THE_DAY_STRAINER = SoupStrainer("div", class_=has_classes("category", "news"))
 
 # --- CONFIGURATION ---
 URL = "https://www.drishtiias.com/current-affairs-news-analysis-editorials"
 DISCORD_WEBHOOK = os.environ.get("DISCORD_WEBHOOK")
 HISTORY_FILE = "history.json"
+PARSE_CACHE_FILE = ".parse_cache.json"
 MAX_HISTORY_SIZE = 50  # Keep more history to be safe
+HISTORY_SECTIONS = ("news", "editorials", "news_articles")
+PAGE_VALIDATORS = ("etag", "last_modified")  # Cache validators of the last fully processed page
+MAX_EMBEDS_PER_MESSAGE = 10  # Discord's limit per webhook message
+TITLE_ELLIPSIS = re.compile(r"\.\.\.")  # Truncation marker Drishti adds to long titles
 
-def send_discord_notification(title, link, category):
-    """Sends a formatted embed to Discord."""
-    if not DISCORD_WEBHOOK:
-        print("ERROR: DISCORD_WEBHOOK environment variable not set!")
-        return False
+# Footer shared by every embed, built once instead of per call
+EMBED_FOOTER = {
+    "text": "Exam Oriented • Daily Updates to Prepare thyself for the Written and SSB of the upcoming UPSC CDS Exam"
+}
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Shared session so page fetches and webhook posts reuse keep-alive connections
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.3)
+))
+
+# CSS selectors (see README for the page structure they target)
+NEWS_LIST_SELECTOR = "div.daily-news-list"
+SECTION_HEADER_SELECTOR = "p.affairs, p.editorials"
+SECTION_LINKS_SELECTOR = "div.box-hide ul li a[href]"
+NEWS_OF_THE_DAY_LINKS_SELECTOR = "div.category.news ul li a[href]"
+
+def parse_html(markup, parse_only=None):
+    """Build a parse tree using the fastest available backend.
     
+    ``parse_only`` is a SoupStrainer applied by the BeautifulSoup fallback.
+    """
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(markup)
+    return BeautifulSoup(markup, BS4_PARSER, parse_only=parse_only)
+
+def select_first(tree, selector):
+    """Return the first node matching a CSS selector, or None."""
+    if LexborHTMLParser is not None:
+        return tree.css_first(selector)
+    return tree.select_one(selector)
+
+def select_all(tree, selector):
+    """Return every node matching a CSS selector, in document order."""
+    if LexborHTMLParser is not None:
+        return tree.css(selector)
+    return tree.select(selector)
+
+def class_names(node):
+    """Return the class names of a node."""
+    if LexborHTMLParser is not None:
+        return (node.attributes.get("class") or "").split()
+    return node.get("class", [])
+
+def lexbor_anchor_title(a_tag):
+    """Read an anchor's title, walking descendants only for nested markup."""
+    child = a_tag.child
+    if child is not None and child.next is None and child.tag == "-text":
+        return a_tag.text(deep=False, strip=True)
+    return a_tag.text(strip=True)
+
+def select_links(tree, selector):
+    """Return title/url dicts for every anchor matching a CSS selector.
+    
+    Drishti anchor texts are plain leaf strings, so an anchor holding a single
+    text node is read directly; descendants are only walked otherwise.
+    """
+    if LexborHTMLParser is not None:
+        return [
+            {"title": lexbor_anchor_title(a_tag), "url": a_tag.attributes["href"]}
+            for a_tag in select_all(tree, selector)
+        ]
+    return [
+        {"title": (a_tag.string or a_tag.get_text()).strip(), "url": a_tag["href"]}
+        for a_tag in select_all(tree, selector)
+    ]
+
+def oldest_first(links, count):
+    """Yield the ``count`` most recent links (pages list newest first), oldest to newest.
+    
+    Indexes the list directly instead of reversing a sliced copy.
+    """
+    for idx in range(min(count, len(links)) - 1, -1, -1):
+        yield links[idx]
+
+def post_webhook(payload):
+    """POST a JSON payload to the Discord webhook, raising on HTTP errors."""
+    response = SESSION.post(DISCORD_WEBHOOK, data=orjson.dumps(payload), headers=JSON_HEADERS, timeout=10)
+    response.raise_for_status()
+
+def build_embed(title, link, category, timestamp):
+    """Build a formatted Discord embed for a single link.
+    
+    ``timestamp`` is the run's ISO-8601 UTC time, shared by every embed.
+    """
     # Clean up title (remove ellipsis, extra spaces)
-    title = title.strip().replace("...", "")
+    title = TITLE_ELLIPSIS.sub("", title).strip()
     
     # Color coding: Green for News, Purple for Editorials
     # color = 3066993 if category == "Daily Current Affairs" else 10181046
     color = 3447003 if category == "Daily Current Affairs" else 15158332
     
-    embed = {
-        "embeds": [{
-            "title": f"{title}",
-            "description": (
-                f"New update available in {category} section!\n"
-                f"[Click to Read full article]({link})"
-            ),
-            "url": link,
-            "color": color,
-            "timestamp": datetime.utcnow().isoformat(),
-            "footer": {
-                "text": "Exam Oriented • Daily Updates to Prepare thyself for the Written and SSB of the upcoming UPSC CDS Exam"
-            }
-        }]
+    return {
+        "title": f"{title}",
+        "description": (
+            f"New update available in {category} section!\n"
+            f"[Click to Read full article]({link})"
+        ),
+        "url": link,
+        "color": color,
+        "timestamp": timestamp,
+        "footer": EMBED_FOOTER
     }
+
+def describe_webhook_error(e):
+    """Format a webhook failure, including Discord's error body when there is one."""
+    response = getattr(e, "response", None)
+    if response is not None and response.text:
+        return f"{e} - {response.text[:500]}"
+    return str(e)
+
+def is_rejected_payload(e):
+    """Check whether Discord permanently rejected the payload (4xx other than rate limiting)."""
+    response = getattr(e, "response", None)
+    return response is not None and 400 <= response.status_code < 500 and response.status_code != 429
+
+def send_discord_embeds(embeds, category):
+    """Send embeds to Discord in as few messages as possible.
     
-    try:
-        response = requests.post(DISCORD_WEBHOOK, json=embed, timeout=10)
-        response.raise_for_status()
-        print(f"✓ Sent: {category} - {title[:50]}...")
-        return True
-    except Exception as e:
-        print(f"✗ Failed to send notification: {e}")
-        return False
+    Returns how many embeds (from the start of the list) were delivered, so
+    callers can record exactly those in history.
+    """
+    if not DISCORD_WEBHOOK:
+        print("ERROR: DISCORD_WEBHOOK environment variable not set!")
+        return 0
+    
+    sent = 0
+    for start in range(0, len(embeds), MAX_EMBEDS_PER_MESSAGE):
+        batch = embeds[start:start + MAX_EMBEDS_PER_MESSAGE]
+        try:
+            post_webhook({"embeds": batch})
+        except Exception as e:
+            print(f"✗ Failed to send notification: {describe_webhook_error(e)}")
+            if len(batch) == 1 or not is_rejected_payload(e):
+                break
+            
+            # One bad embed rejects the whole message, so retry this chunk one
+            # embed at a time, stopping at the first failure to keep the count valid
+            print(f"⟳ Retrying {len(batch)} {category} embeds individually")
+            for embed in batch:
+                try:
+                    post_webhook({"embeds": [embed]})
+                except Exception as e:
+                    print(f"✗ Failed to send: {category} - {embed['title'][:50]}... ({describe_webhook_error(e)})")
+                    return sent
+                print(f"✓ Sent: {category} - {embed['title'][:50]}...")
+                sent += 1
+            continue
+        
+        for embed in batch:
+            print(f"✓ Sent: {category} - {embed['title'][:50]}...")
+        sent += len(batch)
+    
+    return sent
 
 def load_history():
-    """Load previously notified URLs from history file."""
+    """Load previously notified URLs from history file.
+    
+    Each section is an OrderedDict used as an insertion-ordered set, so
+    membership checks are O(1) and the oldest URLs can be evicted first.
+    """
+    data = {}
     if os.path.exists(HISTORY_FILE):
         try:
-            with open(HISTORY_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                # Ensure news_articles key exists for backward compatibility
-                if "news_articles" not in data:
-                    data["news_articles"] = []
-                return data
+            with open(HISTORY_FILE, "rb") as f:
+                data = orjson.loads(f.read())
         except Exception as e:
             print(f"Warning: Could not load history: {e}")
-            return {"news": [], "editorials": [], "news_articles": []}
-    return {"news": [], "editorials": [], "news_articles": []}
+            data = {}
+    # Missing sections (e.g. news_articles in old files) start out empty
+    history = {section: OrderedDict.fromkeys(data.get(section, [])) for section in HISTORY_SECTIONS}
+    for key in PAGE_VALIDATORS:
+        history[key] = data.get(key, "")
+    return history
+
+def remember(history, section, url):
+    """Record a notified URL, evicting the oldest ones beyond MAX_HISTORY_SIZE."""
+    urls = history[section]
+    urls[url] = None
+    urls.move_to_end(url)
+    while len(urls) > MAX_HISTORY_SIZE:
+        urls.popitem(last=False)
+
+def write_file_atomically(path, data):
+    """Replace ``path`` with ``data`` via a temp file, skipping identical content.
+    
+    Returns True if the file was written.
+    """
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    tmp_file = path + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(data)
+    os.replace(tmp_file, path)
+    return True
 
 def save_history(history):
     """Save notified URLs to history file."""
     try:
-        with open(HISTORY_FILE, "w", encoding="utf-8") as f:
-            json.dump(history, f, indent=2, ensure_ascii=False)
-        print(f"✓ History saved ({len(history['news'])} news, {len(history['editorials'])} editorials, {len(history.get('news_articles', []))} articles)")
+        data = {section: list(history[section]) for section in HISTORY_SECTIONS}
+        data.update((key, history[key]) for key in PAGE_VALIDATORS)
+        if not write_file_atomically(HISTORY_FILE, orjson.dumps(data, option=orjson.OPT_INDENT_2)):
+            print("⊘ History unchanged, not rewritten")
+            return
+        print(f"✓ History saved ({len(history['news'])} news, {len(history['editorials'])} editorials, {len(history['news_articles'])} articles)")
     except Exception as e:
         print(f"✗ Error saving history: {e}")
 
-def parse_news_section(soup):
-    """Parse Daily Current Affairs section."""
-    links = []
+def load_parse_cache(body_hash):
+    """Return cached (news_links, editorial_links) if the page body is unchanged."""
+    if os.path.exists(PARSE_CACHE_FILE):
+        try:
+            with open(PARSE_CACHE_FILE, "rb") as f:
+                data = orjson.loads(f.read())
+            if data.get("hash") == body_hash:
+                return data["news_links"], data["editorial_links"]
+        except Exception as e:
+            print(f"Warning: Could not load parse cache: {e}")
+    return None
+
+def save_parse_cache(body_hash, news_links, editorial_links):
+    """Atomically store the links extracted from the page with this body hash."""
     try:
-        # Find the news section by class
-        news_section = soup.find("div", class_="daily-news-list")
-        if not news_section:
-            print("⚠ News section not found")
-            return links
-        
-        # Navigate to the box-hide div containing the list
-        box_hide = news_section.find("div", class_="box-hide")
-        if not box_hide:
-            print("⚠ News box-hide not found")
-            return links
-        
-        # Get the <ul> containing links
-        ul = box_hide.find("ul")
-        if not ul:
-            print("⚠ News <ul> not found")
-            return links
-        
-        # Get all <a> tags in list items
-        for li in ul.find_all("li"):
-            a_tag = li.find("a", href=True)
-            if a_tag:
-                links.append({
-                    "title": a_tag.get_text(strip=True),
-                    "url": a_tag["href"]
-                })
+        write_file_atomically(PARSE_CACHE_FILE, orjson.dumps({
+            "hash": body_hash,
+            "news_links": news_links,
+            "editorial_links": editorial_links
+        }, option=orjson.OPT_INDENT_2))
+    except Exception as e:
+        print(f"✗ Error saving parse cache: {e}")
+
+def parse_sections(tree):
+    """Parse Daily Current Affairs and Important Editorials in a single pass.
+    
+    Returns a ``(news_links, editorial_links)`` tuple.
+    """
+    news_links, editorial_links = [], []
+    try:
+        # Both sections sit inside the news list, so only that subtree is searched
+        news_list = select_first(tree, NEWS_LIST_SELECTOR)
+        if news_list is None:
+            print("⚠ News list not found")
+            return news_links, editorial_links
         
-        print(f"✓ Found {len(links)} news links")
+        # Each header shares its box-slide with the box-hide holding its links
+        for header in select_all(news_list, SECTION_HEADER_SELECTOR):
+            links = select_links(header.parent, SECTION_LINKS_SELECTOR)
+            if "affairs" in class_names(header):
+                news_links = links
+            else:
+                editorial_links = links
         
     except Exception as e:
-        print(f"✗ Error parsing news section: {e}")
+        print(f"✗ Error parsing sections: {e}")
+    
+    if news_links:
+        print(f"✓ Found {len(news_links)} news links")
+    else:
+        print("⚠ News section not found")
+    
+    if editorial_links:
+        print(f"✓ Found {len(editorial_links)} editorial links")
+    else:
+        print("⚠ Editorial section not found")
     
-    return links
+    return news_links, editorial_links
 
 def fetch_news_of_the_day(date_url):
     """Fetch 'News of the Day' articles from a specific date's page."""
     articles = []
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
         print(f"  ⟳ Fetching News of the Day from: {date_url}")
-        response = requests.get(date_url, headers=headers, timeout=15)
+        response = SESSION.get(date_url, timeout=15)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        tree = parse_html(response.text, parse_only=NEWS_OF_THE_DAY_STRAINER)
         
-        # Find the "News of the day" section
         # Based on HTML: <div class="category news"> with <p class="subheading bg-yellow">News of the day</p>
-        news_category = soup.find("div", class_="category news")
-        
-        if not news_category:
+        links = select_links(tree, NEWS_OF_THE_DAY_LINKS_SELECTOR)
+        if not links:
             print("  ⚠ News of the day section not found")
             return articles
         
-        # Get the <ul> containing the article links
-        ul = news_category.find("ul")
-        if not ul:
-            print("  ⚠ News articles <ul> not found")
-            return articles
-        
-        # Extract all article links
-        for li in ul.find_all("li"):
-            a_tag = li.find("a", href=True)
-            if a_tag:
-                # Extract the article title and full URL
-                title = a_tag.get_text(strip=True)
-                href = a_tag.get("href")
-                
-                # The href contains anchor links like #33225, need to build full URL
-                # Format: base_url + href (href already includes the date and anchor)
-                full_url = href if href.startswith("http") else f"https://www.drishtiias.com{href}"
-                
-                articles.append({
-                    "title": title,
-                    "url": full_url
-                })
+        # The hrefs carry anchors like #33225; resolving them against the page
+        # URL handles absolute, root-relative and fragment-only links alike
+        articles = [
+            {"title": link["title"], "url": urljoin(date_url, link["url"])}
+            for link in links
+        ]
         
         print(f"  ✓ Found {len(articles)} news articles")
         
@@ -194,53 +381,31 @@ def send_news_of_the_day_notification(date_title, articles, date_url):
     }
     
     try:
-        response = requests.post(DISCORD_WEBHOOK, json=payload, timeout=10)
-        response.raise_for_status()
+        post_webhook(payload)
         print(f"✓ Sent News of the Day notification ({len(articles)} articles)")
         return True
     except Exception as e:
-        print(f"✗ Failed to send News of the Day notification: {e}")
+        print(f"✗ Failed to send News of the Day notification: {describe_webhook_error(e)}")
         return False
 
-def parse_editorial_section(soup):
-    """Parse Important Editorials section."""
-    links = []
+def page_unchanged(history):
+    """Check with a HEAD request whether the landing page matches the stored validators."""
+    if not (history["etag"] or history["last_modified"]):
+        return False
+    
     try:
-        # Find the editorials header
-        editorial_header = soup.find("p", class_="editorials")
-        if not editorial_header:
-            print("⚠ Editorial header not found")
-            return links
-        
-        # Get the parent box-slide, then find box-hide within it
-        box_slide = editorial_header.parent
-        box_hide = box_slide.find("div", class_="box-hide")
-        
-        if not box_hide:
-            print("⚠ Editorial box-hide not found")
-            return links
-        
-        # Get the <ul> containing links
-        ul = box_hide.find("ul")
-        if not ul:
-            print("⚠ Editorial <ul> not found")
-            return links
-        
-        # Get all <a> tags in list items
-        for li in ul.find_all("li"):
-            a_tag = li.find("a", href=True)
-            if a_tag:
-                links.append({
-                    "title": a_tag.get_text(strip=True),
-                    "url": a_tag["href"]
-                })
-        
-        print(f"✓ Found {len(links)} editorial links")
-        
+        head = SESSION.head(URL, timeout=5, allow_redirects=True)
+        head.raise_for_status()
     except Exception as e:
-        print(f"✗ Error parsing editorial section: {e}")
+        print(f"⚠ HEAD check failed, fetching page anyway: {e}")
+        return False
     
-    return links
+    # Prefer the ETag; fall back to Last-Modified when the server sends no ETag
+    etag = head.headers.get("ETag", "")
+    if etag and history["etag"]:
+        return etag == history["etag"]
+    last_modified = head.headers.get("Last-Modified", "")
+    return bool(last_modified) and last_modified == history["last_modified"]
 
 def main():
     print("=" * 60)
@@ -252,65 +417,97 @@ def main():
         print("✗ DISCORD_WEBHOOK not configured!")
         sys.exit(1)
     
-    # Fetch the webpage
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
+    history = load_history()
+    new_items_found = False
+    all_delivered = True  # Whether every new item on this page reached Discord
+    
+    # A HEAD round trip answers "unchanged?" without transferring the body
+    if page_unchanged(history):
+        print("⊘ Page unchanged since last run (HEAD validators match)")
+        print("=" * 60)
+        return
+    
+    # Fetch the webpage, letting the server answer 304 if it hasn't changed since last run
+    conditional_headers = {}
+    if history["etag"]:
+        conditional_headers["If-None-Match"] = history["etag"]
+    if history["last_modified"]:
+        conditional_headers["If-Modified-Since"] = history["last_modified"]
     
     try:
         print(f"⟳ Fetching {URL}...")
-        response = requests.get(URL, headers=headers, timeout=15)
+        response = SESSION.get(URL, headers=conditional_headers, timeout=15)
         response.raise_for_status()
-        print(f"✓ Page fetched ({len(response.text)} bytes)")
     except Exception as e:
         print(f"✗ Failed to fetch page: {e}")
         sys.exit(1)
     
-    # Parse HTML
-    soup = BeautifulSoup(response.text, 'html.parser')
-    history = load_history()
-    new_items_found = False
+    if response.status_code == 304:
+        print("⊘ Page unchanged since last run (304 Not Modified)")
+        print("=" * 60)
+        return
+    print(f"✓ Page fetched ({len(response.text)} bytes)")
+    
+    # All notifications of a run go out together, so they share one timestamp
+    run_timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
     
-    # Parse both sections
-    news_links = parse_news_section(soup)
-    editorial_links = parse_editorial_section(soup)
+    # Skip parsing entirely if the page body is byte-identical to the last parse
+    body_hash = hashlib.sha256(response.content).hexdigest()
+    cached_links = load_parse_cache(body_hash)
+    if cached_links:
+        news_links, editorial_links = cached_links
+        print(f"✓ Page unchanged, reusing cached links ({len(news_links)} news, {len(editorial_links)} editorials)")
+    else:
+        # Parse HTML and both sections
+        tree = parse_html(response.text, parse_only=SECTION_STRAINER)
+        news_links, editorial_links = parse_sections(tree)
+        # An empty result means parsing failed; caching it would replay the failure
+        if news_links or editorial_links:
+            save_parse_cache(body_hash, news_links, editorial_links)
+        else:
+            # Saving this page's validators would 304/HEAD-skip every later run
+            # until Drishti changes the page, even after the selectors are fixed
+            all_delivered = False
     
     # Process news (most recent first, but notify oldest to newest)
     print("\n--- Processing News ---")
     news_date_to_fetch = None  # Track if we need to fetch News of the Day
     
-    for link_data in reversed(news_links[:5]):  # Check top 5 most recent
-        url = link_data["url"]
-        title = link_data["title"]
-        
-        if url not in history["news"]:
-            if send_discord_notification(title, url, "Daily Current Affairs"):
-                history["news"].append(url)
-                history["news"] = history["news"][-MAX_HISTORY_SIZE:]
-                new_items_found = True
-                
-                # Mark that we need to fetch News of the Day for this date
-                if not news_date_to_fetch:
-                    news_date_to_fetch = {
-                        "url": url,
-                        "title": title
-                    }
+    new_news = []
+    for link_data in oldest_first(news_links, 5):  # Check top 5 most recent
+        if link_data["url"] not in history["news"]:
+            new_news.append(link_data)
         else:
-            print(f"⊘ Already notified: {title[:50]}...")
+            print(f"⊘ Already notified: {link_data['title'][:50]}...")
+    
+    news_embeds = [build_embed(item["title"], item["url"], "Daily Current Affairs", run_timestamp) for item in new_news]
+    sent = send_discord_embeds(news_embeds, "Daily Current Affairs")
+    for link_data in new_news[:sent]:
+        remember(history, "news", link_data["url"])
+        new_items_found = True
+    if sent < len(new_news):
+        all_delivered = False
+    
+    if sent:
+        # Mark that we need to fetch News of the Day for this date
+        news_date_to_fetch = new_news[0]
     
     # Process editorials (most recent first, but notify oldest to newest)
     print("\n--- Processing Editorials ---")
-    for link_data in reversed(editorial_links[:5]):  # Check top 5 most recent
-        url = link_data["url"]
-        title = link_data["title"]
-        
-        if url not in history["editorials"]:
-            if send_discord_notification(title, url, "Important Editorial"):
-                history["editorials"].append(url)
-                history["editorials"] = history["editorials"][-MAX_HISTORY_SIZE:]
-                new_items_found = True
+    new_editorials = []
+    for link_data in oldest_first(editorial_links, 5):  # Check top 5 most recent
+        if link_data["url"] not in history["editorials"]:
+            new_editorials.append(link_data)
         else:
-            print(f"⊘ Already notified: {title[:50]}...")
+            print(f"⊘ Already notified: {link_data['title'][:50]}...")
+    
+    editorial_embeds = [build_embed(item["title"], item["url"], "Important Editorial", run_timestamp) for item in new_editorials]
+    sent = send_discord_embeds(editorial_embeds, "Important Editorial")
+    for link_data in new_editorials[:sent]:
+        remember(history, "editorials", link_data["url"])
+        new_items_found = True
+    if sent < len(new_editorials):
+        all_delivered = False
     
     # NEW FEATURE: Fetch and send "News of the Day" articles if there's a new update
     if news_date_to_fetch:
@@ -319,23 +516,37 @@ def main():
         date_title = news_date_to_fetch["title"]
         
         # Check if we've already sent news articles for this date
-        if date_url not in history.get("news_articles", []):
+        if date_url not in history["news_articles"]:
             articles = fetch_news_of_the_day(date_url)
             
             if articles:
                 if send_news_of_the_day_notification(date_title, articles, date_url):
                     # Add to history to prevent duplicate notifications
-                    if "news_articles" not in history:
-                        history["news_articles"] = []
-                    history["news_articles"].append(date_url)
-                    history["news_articles"] = history["news_articles"][-MAX_HISTORY_SIZE:]
+                    remember(history, "news_articles", date_url)
                     new_items_found = True
+                else:
+                    all_delivered = False
+            else:
+                all_delivered = False
         else:
             print(f"⊘ Already sent News of the Day for: {date_title}")
     
+    # Remember the page version only once everything on it went out, so a
+    # 304 on the next run never hides an item that failed to send
+    validators_changed = False
+    if all_delivered:
+        etag = response.headers.get("ETag", "")
+        last_modified = response.headers.get("Last-Modified", "")
+        if (etag, last_modified) != (history["etag"], history["last_modified"]):
+            history["etag"] = etag
+            history["last_modified"] = last_modified
+            validators_changed = True
+    
     # Save updated history
-    if new_items_found:
+    if new_items_found or validators_changed:
         save_history(history)
+    
+    if new_items_found:
         print("\n✓ New updates sent to Discord!")
     else:
         print("\n⊘ No new updates found")